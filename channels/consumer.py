@@ -1,4 +1,5 @@
 import functools
+import sys
 
 from asgiref.sync import async_to_sync
 
@@ -8,6 +9,10 @@ from .exceptions import StopConsumer
 from .layers import get_channel_layer
 from .utils import await_many_dispatch
 
+# Cache of message type -> handler name, so the transform (and its
+# validation) runs once per distinct type rather than once per message.
+_handler_name_cache = {}
+
 
 def get_handler_name(message):
     """
@@ -17,10 +22,18 @@ def get_handler_name(message):
     # Check message looks OK
     if "type" not in message:
         raise ValueError("Incoming message has no 'type' attribute")
+    message_type = message["type"]
+    try:
+        return _handler_name_cache[message_type]
+    except KeyError:
+        pass
     # Extract type and replace . with _
-    handler_name = message["type"].replace(".", "_")
+    handler_name = message_type.replace(".", "_")
     if handler_name.startswith("_"):
         raise ValueError("Malformed type in message (leading underscore)")
+    # Intern the name so the getattr() in dispatch can compare by identity.
+    handler_name = sys.intern(handler_name)
+    _handler_name_cache[message_type] = handler_name
     return handler_name
 
 
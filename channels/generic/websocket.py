@@ -1,5 +1,10 @@
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from asgiref.sync import async_to_sync
 
 from ..consumer import AsyncConsumer, SyncConsumer
@@ -29,8 +34,10 @@ class WebsocketConsumer(SyncConsumer):
         Called when a WebSocket connection is opened.
         """
         try:
-            for group in self.groups:
-                async_to_sync(self.channel_layer.group_add)(group, self.channel_name)
+            if self.groups:
+                group_add = async_to_sync(self.channel_layer.group_add)
+                for group in self.groups:
+                    group_add(group, self.channel_name)
         except AttributeError:
             raise InvalidChannelLayerError(
                 "BACKEND is unconfigured or doesn't support groups"
@@ -101,10 +108,10 @@ class WebsocketConsumer(SyncConsumer):
         need to call super() all the time.
         """
         try:
-            for group in self.groups:
-                async_to_sync(self.channel_layer.group_discard)(
-                    group, self.channel_name
-                )
+            if self.groups:
+                group_discard = async_to_sync(self.channel_layer.group_discard)
+                for group in self.groups:
+                    group_discard(group, self.channel_name)
         except AttributeError:
             raise InvalidChannelLayerError(
                 "BACKEND is unconfigured or doesn't support groups"
@@ -146,10 +153,29 @@ class JsonWebsocketConsumer(WebsocketConsumer):
 
     @classmethod
     def decode_json(cls, text_data):
+        """
+        Decodes a text frame into JSON content.
+
+        Uses orjson when it is installed. orjson follows RFC 8259
+        strictly, so the non-standard NaN/Infinity literals that
+        json.loads accepts are rejected; override this if you need them.
+        """
+        if orjson is not None:
+            return orjson.loads(text_data)
         return json.loads(text_data)
 
     @classmethod
     def encode_json(cls, content):
+        """
+        Encodes the given content as a JSON text frame payload.
+
+        Uses orjson when it is installed, coercing non-str keys to str
+        like json.dumps does. Unlike json.dumps, NaN/Infinity serialize
+        as null and ints outside the 64-bit range raise TypeError;
+        override this if you need stdlib semantics for those.
+        """
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS).decode()
         return json.dumps(content)
 
 
@@ -285,8 +311,27 @@ class AsyncJsonWebsocketConsumer(AsyncWebsocketConsumer):
 
     @classmethod
     async def decode_json(cls, text_data):
+        """
+        Decodes a text frame into JSON content.
+
+        Uses orjson when it is installed. orjson follows RFC 8259
+        strictly, so the non-standard NaN/Infinity literals that
+        json.loads accepts are rejected; override this if you need them.
+        """
+        if orjson is not None:
+            return orjson.loads(text_data)
         return json.loads(text_data)
 
     @classmethod
     async def encode_json(cls, content):
+        """
+        Encodes the given content as a JSON text frame payload.
+
+        Uses orjson when it is installed, coercing non-str keys to str
+        like json.dumps does. Unlike json.dumps, NaN/Infinity serialize
+        as null and ints outside the 64-bit range raise TypeError;
+        override this if you need stdlib semantics for those.
+        """
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS).decode()
         return json.dumps(content)
@@ -233,6 +233,18 @@ class InMemoryChannelLayer(BaseChannelLayer):
         self.groups = {}
         self.group_expiry = group_expiry
 
+    def _get_queue(self, channel):
+        """
+        Returns the queue for a channel, creating it if it doesn't exist.
+        Only constructs the queue (and looks up capacity) on first use.
+        """
+        queue = self.channels.get(channel)
+        if queue is None:
+            queue = self.channels.setdefault(
+                channel, asyncio.Queue(maxsize=self.get_capacity(channel))
+            )
+        return queue
+
     # Channel layer API
 
     extensions = ["groups", "flush"]
@@ -248,9 +260,7 @@ class InMemoryChannelLayer(BaseChannelLayer):
         # name in message
         assert "__asgi_channel__" not in message
 
-        queue = self.channels.setdefault(
-            channel, asyncio.Queue(maxsize=self.get_capacity(channel))
-        )
+        queue = self._get_queue(channel)
         # Add message
         try:
             queue.put_nowait((time.time() + self.expiry, deepcopy(message)))
@@ -266,9 +276,7 @@ class InMemoryChannelLayer(BaseChannelLayer):
         assert self.valid_channel_name(channel)
         self._clean_expired()
 
-        queue = self.channels.setdefault(
-            channel, asyncio.Queue(maxsize=self.get_capacity(channel))
-        )
+        queue = self._get_queue(channel)
 
         # Do a plain direct receive
         try:
@@ -368,10 +376,10 @@ class InMemoryChannelLayer(BaseChannelLayer):
         self._clean_expired()
 
         # Send to each channel
-        ops = []
-        if group in self.groups:
-            for channel in self.groups[group].keys():
-                ops.append(asyncio.create_task(self.send(channel, message)))
+        ops = [
+            asyncio.create_task(self.send(channel, message))
+            for channel in self.groups.get(group, ())
+        ]
         for send_result in asyncio.as_completed(ops):
             try:
                 await send_result
@@ -1,4 +1,5 @@
 import datetime
+import functools
 import time
 from importlib import import_module
 
@@ -16,6 +17,15 @@ from django.utils.http import http_date
 from channels.db import database_sync_to_async
 
 
+@functools.lru_cache(maxsize=None)
+def _get_session_store(engine):
+    """
+    Resolves (and caches) the SessionStore class for a session engine path,
+    so each connection doesn't pay for an import_module call.
+    """
+    return import_module(engine).SessionStore
+
+
 class CookieMiddleware:
     """
     Extracts cookies from HTTP or WebSocket-style scopes and adds them as a
@@ -106,10 +116,11 @@ class CookieMiddleware:
             ], "samesite must be either 'strict', 'lax' or 'none'"
             cookies[key]["samesite"] = samesite
         # Write out the cookies to the response
-        for c in cookies.values():
-            message.setdefault("headers", []).append(
-                (b"Set-Cookie", bytes(c.output(header="").strip(), encoding="utf-8"))
-            )
+        headers = message.setdefault("headers", [])
+        headers.extend(
+            (b"Set-Cookie", c.output(header="").strip().encode("utf-8"))
+            for c in cookies.values()
+        )
 
     @classmethod
     def delete_cookie(cls, message, key, path="/", domain=None):
@@ -140,7 +151,7 @@ class InstanceSessionWrapper:
 
     def __init__(self, scope, send):
         self.cookie_name = settings.SESSION_COOKIE_NAME
-        self.session_store = import_module(settings.SESSION_ENGINE).SessionStore
+        self.session_store = _get_session_store(settings.SESSION_ENGINE)
 
         self.scope = dict(scope)
 
@@ -172,8 +183,9 @@ class InstanceSessionWrapper:
         """
         # Only save session if we're the outermost session middleware
         if self.activated:
-            modified = self.scope["session"].modified
-            empty = self.scope["session"].is_empty()
+            session = self.scope["session"]
+            modified = session.modified
+            empty = session.is_empty()
             # If this is a message type that we want to save on, and there's
             # changed data, save it. We also save if it's empty as we might
             # not be able to send a cookie-delete along with this message.
@@ -197,18 +209,18 @@ class InstanceSessionWrapper:
                             )
                     else:
                         # Get the expiry data
-                        if self.scope["session"].get_expire_at_browser_close():
+                        if session.get_expire_at_browser_close():
                             max_age = None
                             expires = None
                         else:
-                            max_age = self.scope["session"].get_expiry_age()
+                            max_age = session.get_expiry_age()
                             expires_time = time.time() + max_age
                             expires = http_date(expires_time)
                         # Set the cookie
                         CookieMiddleware.set_cookie(
                             message,
                             self.cookie_name,
-                            self.scope["session"].session_key,
+                            session.session_key,
                             max_age=max_age,
                             expires=expires,
                             domain=settings.SESSION_COOKIE_DOMAIN,
@@ -42,14 +42,15 @@ class HttpCommunicator(ApplicationCommunicator):
         response_start = await self.receive_output(timeout)
         assert response_start["type"] == "http.response.start"
         # Get all body parts
-        response_start["body"] = b""
+        body = []
         while True:
             chunk = await self.receive_output(timeout)
             assert chunk["type"] == "http.response.body"
             assert isinstance(chunk["body"], bytes)
-            response_start["body"] += chunk["body"]
+            body.append(chunk["body"])
             if not chunk.get("more_body", False):
                 break
+        response_start["body"] = b"".join(body)
         # Return structured info
         del response_start["type"]
         response_start.setdefault("headers", [])
@@ -360,6 +360,34 @@ async def test_async_json_websocket_consumer():
         await communicator.wait()
 
 
+@pytest.mark.parametrize("use_orjson", [False, True])
+@pytest.mark.asyncio
+async def test_json_codec_parity(monkeypatch, use_orjson):
+    """
+    Tests that the default JSON codecs round-trip the same content with
+    and without orjson installed, including coercing non-str keys to str
+    the way json.dumps does.
+    """
+    from channels.generic import websocket
+
+    if use_orjson:
+        if websocket.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(websocket, "orjson", None)
+
+    content = {"hello": "world", 1: "one", "nested": [1, 2.5, None, True]}
+    expected = {"hello": "world", "1": "one", "nested": [1, 2.5, None, True]}
+
+    encoded = JsonWebsocketConsumer.encode_json(content)
+    assert isinstance(encoded, str)
+    assert JsonWebsocketConsumer.decode_json(encoded) == expected
+
+    encoded = await AsyncJsonWebsocketConsumer.encode_json(content)
+    assert isinstance(encoded, str)
+    assert await AsyncJsonWebsocketConsumer.decode_json(encoded) == expected
+
+
 @pytest.mark.django_db(transaction=True)
 @pytest.mark.asyncio
 async def test_block_underscored_type_function_call():